@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+"""measure startup time of screen module, run as:
+
+    SCREEN_HEADLESS=1 python bench_startup.py
+"""
+
+import time
+
+t_start = time.perf_counter()
+import screen
+t_import = time.perf_counter()
+screen.set_size(640, 640)
+t_init = time.perf_counter()
+screen.create_sprite('block', None, './pics/unknown.png', 32, 32)
+screen.run()
+t_frame = time.perf_counter()
+
+print('import screen : %6.1f ms' % ((t_import - t_start) * 1000))
+print('set_size      : %6.1f ms' % ((t_init - t_import) * 1000))
+print('first frame   : %6.1f ms' % ((t_frame - t_init) * 1000))
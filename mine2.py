@@ -1,21 +1,23 @@
 
 import screen
 
+IMAGES = [
+    './pics/0.png', './pics/1.png', './pics/2.png',
+    './pics/3.png', './pics/4.png', './pics/5.png',
+    './pics/6.png', './pics/7.png', './pics/8.png',
+    './pics/mine2.png', './pics/flag.png',
+    './pics/unknown.png',  # 11
+    './pics/mine.png',  # 12
+    './pics/mine3.png'  # 13
+]
+
 
 class BlockObj():
     def __init__(self, x, y):
         name = 'block_%d_%d' % (x, y)
         posx = x * 64 + 32
         posy = y * 64 + 32
-        images = [
-            './pics/0.png', './pics/1.png', './pics/2.png',
-            './pics/3.png', './pics/4.png', './pics/5.png',
-            './pics/6.png', './pics/7.png', './pics/8.png',
-            './pics/mine2.png', './pics/flag.png',
-            './pics/unknown.png',  # 11
-            './pics/mine.png',  # 12
-            './pics/mine3.png'  # 13
-        ]
+        images = screen.load_costume_set(IMAGES)
         self.body = screen.create_sprite(name, self, images, posx, posy)
         self.body.switch_costume(11)
         self.mine = False
@@ -6,17 +6,181 @@ Attributes:
     VER (tuple): Description
 """
 
+import json
 import math
+import os
 import random
 import sys
+import threading
+from array import array
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pygame
 from pygame.locals import *
 from pygame.math import Vector2 as Vec2d
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # collide_groups() uses sweep-and-prune instead,
+    # auto-move sprites are moved one by one
+
 VER = (0, 1)
 
 
+class SurfaceCache(object):
+    """LRU cache of surfaces, limited by total pixel memory
+
+    Attributes:
+        - max_bytes (int): memory budget, 0 means no limit
+        - bytes (int): memory used by cached surfaces
+        - hits (int): count of found lookup
+        - misses (int): count of not found lookup
+        - on_evict (function): on_evict(key, surf) called once a surface is
+            removed, None for nothing
+
+    Methods:
+        - get(key): return cached surface, None for no found
+        - put(key, surf): save surface, evict the least recently used ones
+        - pin(surf) / unpin(surf): pinned surface is never evicted
+        - info(): return dict of counters
+        - clear(): remove all surfaces
+    """
+
+    def __init__(self, max_bytes=0):
+        """Summary
+
+        Args:
+            max_bytes (int, optional): memory budget, 0 means no limit
+        """
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.on_evict = None
+        self._items = OrderedDict()  # key : surface
+        self._pins = {}  # surface : pin count
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    @staticmethod
+    def surf_bytes(surf):
+        """return memory used by surface pixels
+
+        Args:
+            surf (pygame.Surface): Description, or pygame.mask.Mask
+
+        Returns:
+            int: Description
+        """
+        if isinstance(surf, pygame.mask.Mask):
+            width, height = surf.get_size()
+            return width * height // 8
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def get(self, key):
+        """return cached surface and mark it as recently used
+
+        Args:
+            key (TYPE): Description
+
+        Returns:
+            pygame.Surface: None for no found
+        """
+        surf = self._items.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return surf
+
+    def put(self, key, surf):
+        """save surface as recently used
+
+        Args:
+            key (TYPE): Description
+            surf (pygame.Surface): Description
+
+        Returns:
+            pygame.Surface: the saved surface
+        """
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= self.surf_bytes(old)
+        self._items[key] = surf
+        self.bytes += self.surf_bytes(surf)
+        self.evict()
+        return surf
+
+    def evict(self):
+        """remove least recently used surfaces until under memory budget,
+        pinned surfaces and the most recently used one are kept
+        """
+        if not self.max_bytes or self.bytes <= self.max_bytes:
+            return
+        for key in list(self._items)[:-1]:
+            surf = self._items[key]
+            if surf in self._pins:
+                continue
+            del self._items[key]
+            self.bytes -= self.surf_bytes(surf)
+            if self.on_evict is not None:
+                self.on_evict(key, surf)
+            if self.bytes <= self.max_bytes:
+                break
+
+    def pin(self, surf):
+        """keep surface in cache until unpin(), the parent surface of a
+        sub-surface (e.g. sprite sheet of a frame) is pinned too
+
+        Args:
+            surf (pygame.Surface): Description
+        """
+        while surf is not None:
+            self._pins[surf] = self._pins.get(surf, 0) + 1
+            surf = surf.get_parent()
+
+    def unpin(self, surf):
+        """allow surface to be evicted once not pinned by anyone
+
+        Args:
+            surf (pygame.Surface): Description
+        """
+        while surf is not None:
+            count = self._pins.pop(surf, 0) - 1
+            if count > 0:
+                self._pins[surf] = count
+            surf = surf.get_parent()
+
+    def info(self):
+        """return counters of cache
+
+        Returns:
+            dict: Description
+        """
+        return {'count': len(self._items), 'bytes': self.bytes,
+                'max_bytes': self.max_bytes, 'hits': self.hits,
+                'misses': self.misses, 'pinned': len(self._pins)}
+
+    def clear(self):
+        """remove all surfaces
+        """
+        items = self._items
+        self._items = OrderedDict()
+        self.bytes = 0
+        if self.on_evict is not None:
+            for key, surf in items.items():
+                self.on_evict(key, surf)
+
+
 class SpriteObj(object):
     """Sprite Object
 
@@ -44,7 +208,44 @@ class SpriteObj(object):
     _oid_cnt = 0
     _obj_dict = {}
     _obj_dead = []  # put name here to delete a sprite obj
-    _image_cache = {}  # save loaded image surface
+    _draw_list = []  # sorted (layer order, z, oid, obj) of shown sprites
+    _layers = {'default': 0}  # layer name : layer order
+    _dirty_areas = []  # area (Rect) to re-draw at next frame
+    # re-draw whole screen once changed area is more than limits
+    _dirty_max_rects = 64
+    _dirty_max_ratio = 0.5
+    _am_objs = {}  # name : auto-move SpriteObj
+    # motion of auto-move sprites moved by numpy, row of _am_data is
+    # (x, y, speed x, speed y, half width, half height, moving) of
+    # SpriteObj in _am_slots, half size is of the rect of _sense_rect()
+    _am_slots = []
+    _am_data = None
+    _am_moved = False  # _am_data moved but not copied to sprites
+    _groups = {}  # group name : {sprite name : SpriteObj}
+    # group name : {cell : [(x, y, SpriteObj)]} of sprite centers,
+    # dropped once a member changes and rebuilt at next query
+    _group_index = {}
+    # spatial hash of sprites for collision and position lookup
+    _grid = {}  # (cell x, cell y) : set of SpriteObj
+    _grid_large = set()  # SpriteObj covers too many cells
+    _grid_moved = []  # SpriteObj changed since last sync
+    _grid_cell = 64  # cell size in pixel
+    _grid_max_cells = 64  # SpriteObj covers more cells saved as large
+    _screen_rect = pygame.Rect(0, 0, 800, 600)  # for culling, see set_size()
+    # loaded image surface, (image file, alpha) : surface
+    _image_cache = SurfaceCache(64 * 1024 * 1024)
+    # (image file, alpha, frame spec) : (sheet, frames), dropped once
+    # sheet is evicted from _image_cache
+    _sheet_cache = {}
+    # rotated & scaled surface shared by all sprites
+    _transform_cache = SurfaceCache(32 * 1024 * 1024)
+    _rotate_step = 1  # rotate angle is rounded to multiple of it
+    # (costume surface, size) : rotate steps, pre-rotated surfaces are
+    # saved in _transform_cache as (surface, size, steps, index)
+    _rotate_atlas = {}
+    _atlas_done = []  # (key, surface) rendered by worker thread
+    # collision mask of rotated & scaled surface, surface : mask
+    _mask_cache = SurfaceCache(8 * 1024 * 1024)
 
     def __init__(self, name=''):
         """Summary
@@ -68,17 +269,32 @@ class SpriteObj(object):
         self._costume = []
         self._costume_used = 0
         self._rotate_angle = 0
-        self._rotate_angle2 = None  # rotated angle for performance
+        self._render_key = None  # (surf, angle, size) of _rotate_surf
         self._rotate_surf = None
         self._size = 100
+        self._blit_surf = None  # surface drawn on screen at last frame
+        self._blit_rect = None  # area drawn on screen at last frame
+        self._cull_key = None  # (surf, size) of _cull_radius
+        self._cull_radius = 0  # max distance from center to any pixel
+        self._bound = None  # cached rect of rotated & scaled costume
+        self._box = None  # cached corners of rotated & scaled costume
+        self._layer = 'default'
+        self._z = self._oid  # draw in order of creation
+        self._draw_key = None  # key in _draw_list, None if not drawn
+        self._grid_cells = None  # (x0, y0, x1, y1) cells in spatial hash
+        self._grid_pending = False  # waiting for spatial hash sync
+        self._alive = True
+        self._group_names = ()  # groups sprite belongs to
         # for motion
         self._vdir = Vec2d(0, -1)  # point up
         self._vpos = Vec2d(0, 0)  # position
         # for auto-move
         self._am_enabled = False
         self._am_speed = 1
+        self._am_slot = None  # row in _am_data, None if moved one by one
         # init actions
         SpriteObj._append_obj(self)
+        self._changed()
 
     def __str__(self):
         """Summary
@@ -136,6 +352,8 @@ class SpriteObj(object):
             raise RuntimeError(
                 'name [%s] has been used for another SpriteObj' % obj.name)
         cls._obj_dict[obj.name] = obj
+        if not obj._hidden:
+            obj._draw_insert()
 
     @classmethod
     def _delete_obj(cls, name_or_obj):
@@ -150,16 +368,350 @@ class SpriteObj(object):
             cls._obj_dead.append(name_or_obj)
 
     @classmethod
-    def _update_all(cls):
+    def _update_all(cls, clear=None):
         """re-draw all managed object on screen
+
+        Args:
+            clear (function, optional): clear(scr, rect) re-draw background
+                in rect. None means whole screen has been re-drawn, otherwise
+                only the changed area is re-drawn
+
+        Returns:
+            list: changed area (Rect) on screen, empty in whole screen mode
         """
+        removed = bool(cls._obj_dead)
         while cls._obj_dead:
             name = cls._obj_dead.pop()
             if name in cls._obj_dict:
                 # print('del %s' % name)
-                del cls._obj_dict[name]
-        for obj in cls._obj_dict.values():
+                obj = cls._obj_dict.pop(name)
+                obj._alive = False
+                for group in obj._group_names:
+                    cls._groups[group].pop(name, None)
+                    cls._group_index.pop(group, None)
+                obj._draw_remove()
+                cls._grid_remove(obj)
+                obj._release()
+                cls._am_objs.pop(name, None)
+                cls._am_release(obj)
+        if removed:
+            # spatial hash queue is only drained by queries, do not let
+            # deleted sprites pile up in it
+            cls._grid_moved = [obj for obj in cls._grid_moved if obj._alive]
+        if cls._atlas_done:
+            cls._atlas_collect()
+        areas = cls._dirty_areas
+        cls._dirty_areas = []
+        scr = pygame.display.get_surface()
+        if clear is None:
+            blits = []
+            append = blits.append
+            for _, _, _, obj in cls._draw_list:
+                obj._update()
+                if obj._blit_rect is not None:
+                    append((obj._blit_surf, obj._blit_rect))
+            scr.blits(blits, doreturn=False)
+            return []
+        # dirty-rect mode, find out the changed area
+        drawn_surf = []
+        drawn_rect = []
+        for _, _, _, obj in cls._draw_list:
+            old_surf, old_rect = obj._blit_surf, obj._blit_rect
             obj._update()
+            new_surf, new_rect = obj._blit_surf, obj._blit_rect
+            if new_rect is not None:
+                drawn_surf.append(new_surf)
+                drawn_rect.append(new_rect)
+            if new_surf is old_surf and new_rect == old_rect:
+                continue
+            if old_rect is None:
+                areas.append(new_rect)
+            elif new_rect is None:
+                areas.append(old_rect)
+            elif old_rect.colliderect(new_rect):
+                areas.append(old_rect.union(new_rect))
+            else:
+                areas.append(old_rect)
+                areas.append(new_rect)
+        scr_rect = scr.get_rect()
+        redraw_all = len(areas) > cls._dirty_max_rects
+        if not redraw_all:
+            areas = cls._merge_rects(areas)
+            changed = 0
+            for area in areas:
+                area = area.clip(scr_rect)
+                changed += area.width * area.height
+            redraw_all = changed > \
+                scr_rect.width * scr_rect.height * cls._dirty_max_ratio
+        if redraw_all:
+            # too many changes, re-draw whole screen is faster
+            clear(scr, scr_rect)
+            scr.blits(list(zip(drawn_surf, drawn_rect)), doreturn=False)
+            return [scr_rect]
+        # re-draw background and sprites in changed area only
+        for area in areas:
+            scr.set_clip(area)
+            clear(scr, area)
+            scr.blits([(drawn_surf[i], drawn_rect[i])
+                       for i in area.collidelistall(drawn_rect)],
+                      doreturn=False)
+        scr.set_clip(None)
+        return areas
+
+    @staticmethod
+    def _merge_rects(rects):
+        """merge overlapped rects into their union
+
+        Args:
+            rects (list): pygame.Rect
+
+        Returns:
+            list: pygame.Rect not overlapped with each other
+        """
+        merged = []
+        for rect in rects:
+            i = rect.collidelist(merged)
+            while i >= 0:
+                rect = rect.union(merged.pop(i))
+                i = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def _changed(self):
+        """mark position, costume, angle or size of sprite changed,
+        bounds are rebuilt and spatial hash is synced at next query
+        """
+        self._stale()
+        if self._am_slot is not None:
+            self._am_push()
+
+    def _stale(self):
+        """drop cached bounds and index of sprite, see _changed()
+        """
+        self._bound = None
+        self._box = None
+        for group in self._group_names:
+            SpriteObj._group_index.pop(group, None)
+        if not self._grid_pending:
+            self._grid_pending = True
+            SpriteObj._grid_moved.append(self)
+
+    @classmethod
+    def _grid_remove(cls, obj):
+        """remove sprite from spatial hash
+
+        Args:
+            obj (SpriteObj): Description
+        """
+        cells = obj._grid_cells
+        if cells is None:
+            return
+        obj._grid_cells = None
+        if cells == 'large':
+            cls._grid_large.discard(obj)
+            return
+        grid = cls._grid
+        x0, y0, x1, y1 = cells
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                objs = grid[(cx, cy)]
+                objs.discard(obj)
+                if not objs:
+                    del grid[(cx, cy)]
+
+    @classmethod
+    def _grid_range(cls, rect):
+        """return (x0, y0, x1, y1) cells covered by rect
+        """
+        size = cls._grid_cell
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    @classmethod
+    def _grid_sync(cls):
+        """update spatial hash for changed sprites
+        """
+        moved = cls._grid_moved
+        if not moved:
+            return
+        cls._grid_moved = []
+        grid = cls._grid
+        for obj in moved:
+            obj._grid_pending = False
+            if not obj._alive:
+                continue
+            rect = obj._sense_rect()
+            cells = None
+            if rect is not None:
+                cells = cls._grid_range(rect)
+                x0, y0, x1, y1 = cells
+                if (x1 - x0 + 1) * (y1 - y0 + 1) > cls._grid_max_cells:
+                    cells = 'large'
+            if cells == obj._grid_cells:
+                continue
+            cls._grid_remove(obj)
+            obj._grid_cells = cells
+            if cells is None:
+                continue
+            if cells == 'large':
+                cls._grid_large.add(obj)
+                continue
+            for cy in range(y0, y1 + 1):
+                for cx in range(x0, x1 + 1):
+                    objs = grid.get((cx, cy))
+                    if objs is None:
+                        grid[(cx, cy)] = {obj}
+                    else:
+                        objs.add(obj)
+
+    @classmethod
+    def _grid_query(cls, rect):
+        """return sprites may overlap rect, found in spatial hash
+
+        Args:
+            rect (pygame.Rect): Description
+
+        Returns:
+            set: SpriteObj
+        """
+        cls._grid_sync()
+        grid = cls._grid
+        found = set(cls._grid_large)
+        x0, y0, x1, y1 = cls._grid_range(rect)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(grid):
+            # rect covers more cells than saved
+            for (cx, cy), objs in grid.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found.update(objs)
+            return found
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                objs = grid.get((cx, cy))
+                if objs:
+                    found.update(objs)
+        return found
+
+    @classmethod
+    def _group_cells(cls, name):
+        """return centers of group members in grid cells, the index is
+        rebuilt once after any member has changed
+
+        Args:
+            name (str): group name
+
+        Returns:
+            dict: {(cx, cy) : [(x, y, SpriteObj)]}
+        """
+        cells = cls._group_index.get(name)
+        if cells is None:
+            cells = {}
+            size = cls._grid_cell
+            for obj in cls._groups.get(name, {}).values():
+                x, y = obj._vpos
+                cell = (int(x // size), int(y // size))
+                entry = (x, y, obj)
+                objs = cells.get(cell)
+                if objs is None:
+                    cells[cell] = [entry]
+                else:
+                    objs.append(entry)
+            cls._group_index[name] = cells
+        return cells
+
+    @classmethod
+    def _step_all(cls):
+        """move all auto-move sprites one simulation step
+        """
+        if np is None:
+            for obj in cls._am_objs.values():
+                obj._step()
+            return
+        slots = cls._am_slots
+        if not slots:
+            return
+        data = cls._am_data[:len(slots)]
+        data[:, 0:2] += data[:, 2:4] * data[:, 6:7]
+        # delete sprites out of screen, as same as _step()
+        x, y = data[:, 0], data[:, 1]
+        half_w, half_h = data[:, 4], data[:, 5]
+        scr_rect = cls._screen_rect
+        out = (data[:, 6] > 0) & ((x + half_w <= scr_rect.left) |
+                                  (x - half_w >= scr_rect.right) |
+                                  (y + half_h <= scr_rect.top) |
+                                  (y - half_h >= scr_rect.bottom))
+        for i in np.flatnonzero(out).tolist():
+            obj = slots[i]
+            obj._am_enabled = False
+            obj._vpos.xy = data[i, 0:2].tolist()
+            data[i, 6] = 0
+            cls._delete_obj(obj)
+        cls._am_moved = True
+
+    @classmethod
+    def _am_sync(cls):
+        """copy positions moved by _step_all() to sprites
+        """
+        if not cls._am_moved:
+            return
+        cls._am_moved = False
+        slots = cls._am_slots
+        data = cls._am_data[:len(slots)]
+        positions = data[:, 0:2].tolist()
+        for i in np.flatnonzero(data[:, 6]).tolist():
+            obj = slots[i]
+            obj._vpos.xy = positions[i]
+            obj._stale()
+
+    def _am_push(self):
+        """copy position, speed and state of sprite to _am_data
+        """
+        if self._am_slot is None:
+            if np is None or not self._am_enabled:
+                return
+            SpriteObj._am_alloc(self)
+        row = SpriteObj._am_data[self._am_slot]
+        row[0:2] = self._vpos
+        row[2:4] = self._vdir * self._am_speed
+        moving = self._am_enabled and not self._hidden and \
+            self._surf is not None
+        if moving:
+            rect = self._sense_rect()
+            row[4:6] = rect.width / 2, rect.height / 2
+        row[6] = 1 if moving else 0
+
+    @classmethod
+    def _am_alloc(cls, obj):
+        """add a row in _am_data for sprite, rows are doubled once full
+
+        Args:
+            obj (SpriteObj): Description
+        """
+        num = len(cls._am_slots)
+        if cls._am_data is None or num == len(cls._am_data):
+            data = np.zeros((max(64, num * 2), 7))
+            if num:
+                data[:num] = cls._am_data
+            cls._am_data = data
+        obj._am_slot = num
+        cls._am_slots.append(obj)
+
+    @classmethod
+    def _am_release(cls, obj):
+        """remove sprite from _am_data, last row is moved to its place
+
+        Args:
+            obj (SpriteObj): Description
+        """
+        i = obj._am_slot
+        if i is None:
+            return
+        obj._am_slot = None
+        slots = cls._am_slots
+        last = slots.pop()
+        if last is not obj:
+            slots[i] = last
+            last._am_slot = i
+            cls._am_data[i] = cls._am_data[len(slots)]
 
     @classmethod
     def load_image(cls, image_file, alpha=False):
@@ -175,16 +727,109 @@ class SpriteObj(object):
         Raises:
             IOError: Description
         """
-        if image_file not in cls._image_cache:
-            if image_file.endswith('.png') or alpha:
-                surf = pygame.image.load(image_file).convert_alpha()
-            else:
-                surf = pygame.image.load(image_file).convert()
-            if surf:
-                cls._image_cache[image_file] = surf
-            else:
-                raise IOError('fail to load image %s' % image_file)
-        return cls._image_cache[image_file]
+        surf = cls._image_cache.get(cls._image_key(image_file, alpha))
+        if surf is None:
+            surf = cls._convert_image(image_file,
+                                      pygame.image.load(image_file), alpha)
+        return surf
+
+    @staticmethod
+    def _image_key(image_file, alpha=False):
+        """return key of image cache, png file always has alpha
+
+        Returns:
+            tuple: (image file, alpha)
+        """
+        return (image_file, bool(alpha) or image_file.endswith('.png'))
+
+    @classmethod
+    def _convert_image(cls, image_file, surf, alpha=False):
+        """convert decoded image to display format, and save in cache
+
+        Args:
+            image_file (TYPE): Description
+            surf (pygame.Surface): decoded image
+            alpha (bool, optional): Description
+
+        Returns:
+            TYPE: Description
+
+        Raises:
+            IOError: Description
+        """
+        if not surf:
+            raise IOError('fail to load image %s' % image_file)
+        _lazy_init()  # convert() needs display
+        key = cls._image_key(image_file, alpha)
+        if key[1]:
+            surf = surf.convert_alpha()
+        else:
+            surf = surf.convert()
+        return cls._image_cache.put(key, surf)
+
+    @classmethod
+    def load_sheet(cls, image_file, grid=None, frames=None, alpha=False):
+        """load a sprite sheet, cut it into frames by a grid or a rect map.
+        frames are sub-surfaces which share the sheet pixels
+
+        Args:
+            image_file (str): sprite sheet image file path
+            grid (tuple, optional): (cols, rows), cut sheet into same size
+                frames, ordered from left to right, top to bottom
+            frames (str/dict, optional): rect map, json file path or dict of
+                name : [x, y, w, h] or name : {"x", "y", "w", "h"}, the
+                TexturePacker json {"frames": {name: {"frame": rect}}} is
+                also supported
+            alpha (bool, optional): Description
+
+        Returns:
+            list: frame surfaces if cut by grid
+            dict: name : frame surface if cut by rect map
+
+        Raises:
+            ValueError: neither grid nor frames given
+        """
+        key = (image_file, alpha, tuple(grid) if grid else frames)
+        cacheable = not isinstance(frames, dict)
+        if cacheable and key in cls._sheet_cache:
+            return cls._sheet_cache[key][1]
+        sheet = cls.load_image(image_file, alpha)
+        if grid:
+            cols, rows = grid
+            width = sheet.get_width() // cols
+            height = sheet.get_height() // rows
+            result = [sheet.subsurface((x * width, y * height, width, height))
+                      for y in range(rows) for x in range(cols)]
+        elif frames:
+            rect_map = frames
+            if isinstance(frames, str):
+                with open(frames) as f:
+                    rect_map = json.load(f)
+            rect_map = rect_map.get('frames', rect_map)
+            result = {}
+            for name, rect in rect_map.items():
+                rect = rect.get('frame', rect) if isinstance(rect, dict) \
+                    else rect
+                if isinstance(rect, dict):
+                    rect = (rect['x'], rect['y'], rect['w'], rect['h'])
+                result[name] = sheet.subsurface(rect)
+        else:
+            raise ValueError('load_sheet expects grid or frames')
+        if cacheable:
+            cls._sheet_cache[key] = (sheet, result)
+        return result
+
+    @classmethod
+    def _sheet_evicted(cls, key, surf):
+        """drop frames cut from an image evicted from _image_cache
+
+        Args:
+            key (tuple): key of image
+            surf (pygame.Surface): evicted image
+        """
+        for sheet_key, (sheet, _) in list(cls._sheet_cache.items()):
+            if sheet is surf:
+                del cls._sheet_cache[sheet_key]
 
     @property
     def name(self):
@@ -226,15 +871,25 @@ class SpriteObj(object):
         return self._rect.bottomleft
 
     @property
-    def size_h(self):
+    def size_w(self):
+        """width of scaled costume
+
+        Returns:
+            int: Description
+        """
         if self._surf is not None:
-            return self._surf.get_width() * self._size / 100
+            return SpriteObj._transform(self._surf, 0, self._size).get_width()
         return 0
 
     @property
-    def size_w(self):
+    def size_h(self):
+        """height of scaled costume
+
+        Returns:
+            int: Description
+        """
         if self._surf is not None:
-            return self._surf.get_height() * self._size / 100
+            return SpriteObj._transform(self._surf, 0, self._size).get_height()
         return 0
 
     @property
@@ -242,10 +897,21 @@ class SpriteObj(object):
         return self._size
 
     def set_size(self, amount):
-        self._size = amount
-    
+        """set size in percent of costume, 100 is original size
+
+        Args:
+            amount (int): Description
+        """
+        self._size = max(amount, 0)
+        self._changed()
+
     def change_size(self, amount):
-        self._size += amount
+        """change size in percent of costume
+
+        Args:
+            amount (int): Description
+        """
+        self.set_size(self._size + amount)
 
     @property
     def pos(self):
@@ -277,6 +943,39 @@ class SpriteObj(object):
     def set_pos(self, xy_or_x, y=None):
         pos = xy_or_x if y is None else (xy_or_x, y)
         self._vpos = Vec2d(pos)
+        self._changed()
+
+    @property
+    def groups(self):
+        """names of groups sprite belongs to (tuple)
+
+        Returns:
+            TYPE: Description
+        """
+        return self._group_names
+
+    def add_group(self, name):
+        """add sprite into a group, see screen.group()
+
+        Args:
+            name (str): group name
+        """
+        if name not in self._group_names:
+            self._group_names += (name,)
+            SpriteObj._groups.setdefault(name, {})[self._name] = self
+            SpriteObj._group_index.pop(name, None)
+
+    def remove_group(self, name):
+        """remove sprite from a group
+
+        Args:
+            name (str): group name
+        """
+        if name in self._group_names:
+            self._group_names = tuple(
+                each for each in self._group_names if each != name)
+            SpriteObj._groups[name].pop(self._name, None)
+            SpriteObj._group_index.pop(name, None)
 
     def set_owner(self, value):
         """
@@ -289,6 +988,77 @@ class SpriteObj(object):
         """
         self._owner = value
 
+    def _sense_rect(self):
+        """return the rect used by collision and position check, it bounds
+        the rotated & scaled costume, cached until sprite is changed.
+        the rect is shared, do not modify it
+
+        Returns:
+            pygame.Rect: None if sprite has no costume
+        """
+        if self._bound is None:
+            self._bound = self._make_bound()
+        return self._bound
+
+    def _make_bound(self):
+        """build the rect returned by _sense_rect(), its size is computed
+        as pygame.transform.rotate() does, costume is not transformed
+        until it is drawn
+
+        Returns:
+            pygame.Rect: Description
+        """
+        if self._surf is None:
+            return None
+        width, height = self._surf.get_size()
+        if self._size != 100:
+            width = int(width * self._size / 100)
+            height = int(height * self._size / 100)
+        angle, _ = SpriteObj._render_angle(
+            self._surf, self._rotate_angle, self._size)
+        if angle % 90:
+            rad = math.radians(angle)
+            cos, sin = abs(math.cos(rad)), abs(math.sin(rad))
+            width, height = (int(width * cos + height * sin),
+                             int(width * sin + height * cos))
+        elif angle % 180:
+            width, height = height, width
+        rect = pygame.Rect(0, 0, width, height)
+        rect.center = self._vpos
+        return rect
+
+    def get_bounds(self):
+        """return the bounding rect of rotated & scaled costume
+
+        Returns:
+            pygame.Rect: None if sprite has no costume
+        """
+        rect = self._sense_rect()
+        return rect.copy() if rect is not None else None
+
+    def get_corners(self):
+        """return the oriented box of rotated & scaled costume
+
+        Returns:
+            list: 4 corner positions, clockwise from top left of costume,
+                empty if sprite has no costume
+        """
+        if self._box is None:
+            self._box = []
+            if self._surf is not None:
+                w, h = self._surf.get_size()
+                half_w = Vec2d(w * self._size / 200, 0)
+                half_h = Vec2d(0, h * self._size / 200)
+                if self._rotate_angle:
+                    half_w.rotate_ip(self._rotate_angle)
+                    half_h.rotate_ip(self._rotate_angle)
+                center = self._vpos
+                self._box = [tuple(center - half_w - half_h),
+                             tuple(center + half_w - half_h),
+                             tuple(center + half_w + half_h),
+                             tuple(center - half_w + half_h)]
+        return list(self._box)
+
     def in_pos(self, xy_or_x, y=None):
         """check if SpriteObj cover given position
 
@@ -299,13 +1069,11 @@ class SpriteObj(object):
         Returns:
             - bool: return True if sprite object at position
         """
-        if self._hidden:
+        if self._hidden or self._surf is None:
             return False
         x = xy_or_x if y is not None else xy_or_x[0]
         y = y if y is not None else xy_or_x[1]
-        rect = self._surf.get_rect()
-        rect.center = (self._vpos[0], self._vpos[1])
-        return rect.collidepoint(x, y)
+        return self._sense_rect().collidepoint(x, y)
 
     def out_of_screen(self):
         """check if sprite is out of screen
@@ -313,13 +1081,10 @@ class SpriteObj(object):
         Returns:
             bool: return True if SpriteObj out of screen
         """
-        scr_rect = pygame.display.get_surface().get_rect()
-        if self._rotate_angle and self._rotate_surf:
-            obj_rect = self._rotate_surf.get_rect(
-                center=(self._vpos[0], self._vpos[1]))
-        else:
-            obj_rect = self._surf.get_rect(
-                center=(self._vpos[0], self._vpos[1]))
+        scr_rect = SpriteObj._screen_rect
+        obj_rect = self._sense_rect()
+        if obj_rect is None:
+            return not scr_rect.collidepoint(self._vpos)
         return not scr_rect.colliderect(obj_rect)
 
     def collide_objs(self, objs):
@@ -332,45 +1097,279 @@ class SpriteObj(object):
             bool: return True if this SpriteObjs covered others
         """
         cobjs = []
-        if objs:
+        self_rect = self._sense_rect()
+        if objs and self_rect is not None:
+            if len(objs) > 8:
+                # only check sprites nearby, found in spatial hash
+                near = SpriteObj._grid_query(self_rect)
+                near.intersection_update(objs)
+                objs = sorted(near, key=lambda obj: obj._oid)
             for obj in objs:
-                self_rect = self._surf.get_rect(center=self.pos)
-                obj_rect = obj._surf.get_rect(center=obj.pos)
-                if self_rect.colliderect(obj_rect):
+                obj_rect = obj._sense_rect()
+                if obj_rect is not None and self_rect.colliderect(obj_rect):
                     cobjs.append(obj)
         return cobjs
 
+    def _mask(self):
+        """return collision mask and rect of rotated & scaled costume,
+        mask is cached for each rotated & scaled surface
+
+        Returns:
+            tuple: (pygame.mask.Mask, pygame.Rect)
+        """
+        self.__rotate_n_scale()
+        surf = self._rotate_surf
+        mask = SpriteObj._mask_cache.get(surf)
+        if mask is None:
+            mask = SpriteObj._mask_cache.put(
+                surf, pygame.mask.from_surface(surf))
+        return mask, surf.get_rect(center=self._vpos)
+
+    def is_touch_obj(self, obj):
+        """check if sprite touches another sprite, pixel by pixel,
+        rotate and size are counted
+
+        Args:
+            obj (SpriteObj): Description
+
+        Returns:
+            bool: Description
+        """
+        if self._hidden or self._surf is None or \
+                obj._hidden or obj._surf is None:
+            return False
+        # cheap rect test first, bounds may differ from rendered surface by
+        # rounding, so the rect of mask is tested again
+        if not self._sense_rect().inflate(2, 2).colliderect(
+                obj._sense_rect().inflate(2, 2)):
+            return False
+        self_mask, self_rect = self._mask()
+        obj_mask, obj_rect = obj._mask()
+        if not self_rect.colliderect(obj_rect):
+            return False
+        offset = (obj_rect.left - self_rect.left, obj_rect.top - self_rect.top)
+        return self_mask.overlap(obj_mask, offset) is not None
+
+    def is_touch_mouse(self):
+        """check if mouse is on sprite, pixel by pixel
+
+        Returns:
+            bool: Description
+        """
+        if self._hidden or self._surf is None:
+            return False
+        x, y = pygame.mouse.get_pos()
+        if not self._sense_rect().inflate(2, 2).collidepoint(x, y):
+            return False
+        mask, rect = self._mask()
+        if not rect.collidepoint(x, y):
+            return False
+        return bool(mask.get_at((x - rect.left, y - rect.top)))
+
     def _update(self):
-        """update the sprite on screen with new custome and new position
+        """update the sprite with new custome and new position,
+        save the surface and rect which should be drawn on screen.
+        sprite out of screen is not rotated or drawn
 
         Returns:
             TYPE: Description
         """
+        self._blit_surf = None
+        self._blit_rect = None
         if self._hidden:
             return
         if self._surf is not None:
-            scr = pygame.display.get_surface()
-            self.__rotate_n_scale()
-            rect = self._rotate_surf.get_rect(
-                center=(self._vpos[0], self._vpos[1]))
-            scr.blit(self._rotate_surf, rect)
-            # auto-move
-            if self._am_enabled:
-                self.move(self._am_speed)
-                if self.out_of_screen():
-                    self._delete_obj(self)
+            if (self._surf, self._size) != self._cull_key:
+                self._cull_key = (self._surf, self._size)
+                self._cull_radius = math.hypot(*self._surf.get_size()) * \
+                    self._size / 200
+            x, y = self._vpos
+            r = self._cull_radius
+            scr_rect = SpriteObj._screen_rect
+            if scr_rect.left - r < x < scr_rect.right + r and \
+                    scr_rect.top - r < y < scr_rect.bottom + r:
+                self.__rotate_n_scale()
+                self._blit_surf = self._rotate_surf
+                self._blit_rect = self._rotate_surf.get_rect(
+                    center=self._vpos)
+
+    def _step(self):
+        """auto-move one simulation step, delete sprite once out of screen
+        """
+        if self._hidden or not self._am_enabled or self._surf is None:
+            return
+        self.move(self._am_speed)
+        # as same as _step_all() with numpy, rect of sprite is not rounded
+        rect = self._sense_rect()
+        half_w, half_h = rect.width / 2, rect.height / 2
+        x, y = self._vpos
+        scr_rect = SpriteObj._screen_rect
+        if x + half_w <= scr_rect.left or x - half_w >= scr_rect.right or \
+                y + half_h <= scr_rect.top or y - half_h >= scr_rect.bottom:
+            self._am_enabled = False
+            self._delete_obj(self)
 
     def show(self):
         """
         Makes sprite appear on the Stage
         """
-        self._hidden = False
+        if self._hidden:
+            self._hidden = False
+            if self._name in SpriteObj._obj_dict:
+                self._draw_insert()
+            if self._am_slot is not None:
+                self._am_push()
 
     def hide(self):
         """
         Make a hide-and-seek game with characters that appear and disappear.
         """
-        self._hidden = True
+        if not self._hidden:
+            self._hidden = True
+            self._draw_remove()
+            if self._am_slot is not None:
+                self._am_push()
+
+    # Layer Methods
+    def _draw_insert(self):
+        """insert sprite into sorted draw list"""
+        order = SpriteObj._layers[self._layer]
+        self._draw_key = (order, self._z, self._oid, self)
+        insort(SpriteObj._draw_list, self._draw_key)
+
+    def _draw_remove(self):
+        """remove sprite from sorted draw list, its area will be re-drawn"""
+        if self._draw_key is not None:
+            draw_list = SpriteObj._draw_list
+            del draw_list[bisect_left(draw_list, self._draw_key)]
+            self._draw_key = None
+        if self._blit_rect is not None:
+            SpriteObj._dirty_areas.append(self._blit_rect)
+            self._blit_surf = None
+            self._blit_rect = None
+
+    def __reorder(self, layer, z):
+        """move sprite in draw list"""
+        if layer not in SpriteObj._layers:
+            raise ValueError('unknown layer [%s], please add_layer() first' %
+                             layer)
+        drawn = self._draw_key is not None
+        if drawn:
+            self._draw_remove()
+        self._layer = layer
+        self._z = z
+        if drawn:
+            self._draw_insert()
+
+    @property
+    def layer(self):
+        """name of the layer sprite drawn in (str)
+
+        Returns:
+            TYPE: Description
+        """
+        return self._layer
+
+    @property
+    def z(self):
+        """draw order in layer, bigger is front (float)
+
+        Returns:
+            TYPE: Description
+        """
+        return self._z
+
+    def set_layer(self, layer, z=None):
+        """move sprite to a layer
+
+        Args:
+            layer (str): layer name, see add_layer()
+            z (float, optional): draw order in layer, default keep
+        """
+        self.__reorder(layer, self._z if z is None else z)
+
+    def set_z(self, z):
+        """set draw order in layer, bigger is front
+
+        Args:
+            z (float): Description
+        """
+        self.__reorder(self._layer, z)
+
+    def __layer_range(self):
+        """return (begin, end) of the layer in draw list, and position of
+        this sprite in draw list, found by binary search
+        """
+        draw_list = SpriteObj._draw_list
+        order = SpriteObj._layers[self._layer]
+        begin = bisect_left(draw_list, (order,))
+        end = bisect_left(draw_list, (order, math.inf), begin)
+        pos = bisect_left(draw_list, self._draw_key, begin, end) \
+            if self._draw_key else None
+        return begin, end, pos
+
+    def go_front(self):
+        """go to front of the layer
+        """
+        begin, end, pos = self.__layer_range()
+        if begin < end and SpriteObj._draw_list[end - 1][3] is not self:
+            self.set_z(self.__z_between(begin, end, end))
+
+    def go_back(self):
+        """go to back of the layer
+        """
+        begin, end, pos = self.__layer_range()
+        if begin < end and SpriteObj._draw_list[begin][3] is not self:
+            self.set_z(self.__z_between(begin, end, begin))
+
+    def __z_between(self, begin, end, index):
+        """return z to insert sprite before draw_list[index] of the layer
+
+        Args:
+            begin (int): first position of the layer in draw list
+            end (int): position after the layer in draw list
+            index (int): Description
+
+        Returns:
+            float: Description
+        """
+        draw_list = SpriteObj._draw_list
+        if index == begin:
+            return draw_list[begin][1] - 1
+        if index == end:
+            return draw_list[end - 1][1] + 1
+        z = (draw_list[index - 1][1] + draw_list[index][1]) / 2
+        if draw_list[index - 1][1] < z < draw_list[index][1]:
+            return z
+        # no room between, re-number z of whole layer, order is not changed
+        for i in range(begin, end):
+            obj = draw_list[i][3]
+            obj._z = i - begin
+            obj._draw_key = (draw_list[i][0], obj._z, obj._oid, obj)
+            draw_list[i] = obj._draw_key
+        return index - begin - 0.5
+
+    def back_layout(self, num=1):
+        """go back some layouts, behind other sprites in the layer
+
+        Args:
+            num (int, optional): count of sprites to go behind
+        """
+        begin, end, pos = self.__layer_range()
+        if pos is None or num <= 0 or pos == begin:
+            return
+        self.set_z(self.__z_between(begin, end, max(pos - num, begin)))
+
+    def forward_layout(self, num=1):
+        """go forward some layouts, in front of other sprites in the layer
+
+        Args:
+            num (int, optional): count of sprites to go in front of
+        """
+        begin, end, pos = self.__layer_range()
+        if pos is None or num <= 0 or pos == end - 1:
+            return
+        self.set_z(self.__z_between(begin, end, min(pos + num + 1, end)))
 
     # Motions Methods
     @property
@@ -393,6 +1392,9 @@ class SpriteObj(object):
         self._vdir = self._vdir.rotate(angle)
         if rotate:
             self._rotate_angle = int(self.dir)
+            self._changed()
+        elif self._am_slot is not None:
+            self._am_push()
 
     def point_dir(self, angle, rotate=False):
         """
@@ -406,6 +1408,9 @@ class SpriteObj(object):
         self._vdir = Vec2d(0, -1).rotate(angle)
         if rotate:
             self._rotate_angle = int(self.dir)
+            self._changed()
+        elif self._am_slot is not None:
+            self._am_push()
 
     def turn_left(self, angle, rotate=False):
         """
@@ -450,6 +1455,38 @@ class SpriteObj(object):
         """
         self.point_pos(pygame.mouse.get_pos(), rotate=rotate)
 
+    def distance_to_pos(self, xy_or_x, y=None):
+        """return distance from sprite to a position
+
+        Args:
+            xy_or_x (tuple/int): Description
+            y (int, optional): Description
+
+        Returns:
+            float: Description
+        """
+        pos = xy_or_x if y is None else (xy_or_x, y)
+        return self._vpos.distance_to(pos)
+
+    def distance_to_mouse(self):
+        """return distance from sprite to mouse
+
+        Returns:
+            float: Description
+        """
+        return self.distance_to_pos(pygame.mouse.get_pos())
+
+    def distance_to_obj(self, obj):
+        """return distance between centers of 2 sprites
+
+        Args:
+            obj (SpriteObj): Description
+
+        Returns:
+            float: Description
+        """
+        return self._vpos.distance_to(obj._vpos)
+
     def point_obj(self, obj, rotate=False):
         """Set current moving direction to a SpriteObj
 
@@ -466,6 +1503,7 @@ class SpriteObj(object):
           - steps (int): Description
         """
         self._vpos += self._vdir * steps
+        self._changed()
 
     def move_to(self, xy_or_x, y=None):
         """
@@ -479,15 +1517,18 @@ class SpriteObj(object):
         self.set_pos(pos)
 
     def set_auto_move(self, speed, dir):
-        """Summary
+        """move automatically on every simulation step (see run()),
+        sprite is deleted once out of screen
 
         Args:
-            speed (TYPE): Description
+            speed (TYPE): steps per simulation step
             dir (TYPE): Description
         """
         self._am_enabled = True
+        SpriteObj._am_objs[self._name] = self
         self._am_speed = speed
         self.point_dir(dir, True)
+        self._am_push()
 
     def change_x(self, amount):
         """Change the x position by this amount
@@ -496,6 +1537,7 @@ class SpriteObj(object):
           - amount (int): step in x-arix (postive to right)
         """
         self._vpos[0] += amount
+        self._changed()
 
     def change_y(self, amount):
         """Change the y position by this amount
@@ -504,6 +1546,7 @@ class SpriteObj(object):
           - amount (int): step in y-arix (postive to up)
         """
         self._vpos[1] += amount
+        self._changed()
 
     def set_x(self, amount):
         """Set the x position of a sprite
@@ -512,6 +1555,7 @@ class SpriteObj(object):
           - amount (int): position x
         """
         self._vpos[0] = amount
+        self._changed()
 
     def set_y(self, amount):
         """Change the y position by this amount
@@ -520,138 +1564,685 @@ class SpriteObj(object):
           - amount (int): position y
         """
         self._vpos[1] = amount
+        self._changed()
+
+    @staticmethod
+    def _make_transform(surf, angle, size):
+        """create a scaled, then rotated surface
+
+        Args:
+            surf (pygame.Surface): original costume
+            angle (int): rotate angle, clockwise
+            size (int): scale in percent
+
+        Returns:
+            pygame.Surface: Description
+        """
+        if size != 100:
+            width, height = surf.get_size()
+            surf = pygame.transform.scale(
+                surf, (int(width * size / 100), int(height * size / 100)))
+        if angle % 360:
+            surf = pygame.transform.rotate(surf, -angle)
+        return surf
+
+    @classmethod
+    def _render_angle(cls, surf, angle, size):
+        """return the angle costume is really rotated to when drawn, it is
+        rounded to a pre-rotated angle of atlas, or multiple of rotate step
+
+        Args:
+            surf (pygame.Surface): original costume
+            angle (int): rotate angle, clockwise
+            size (int): scale in percent
+
+        Returns:
+            tuple: (angle, key of atlas surface in transform cache), key is
+                None if costume has no atlas
+        """
+        steps = cls._rotate_atlas.get((surf, size))
+        if steps is not None:
+            index = int(round(angle * steps / 360)) % steps
+            return index * 360 / steps, (surf, size, steps, index)
+        step = cls._rotate_step
+        return int(round(angle / step) * step) % 360, None
+
+    @classmethod
+    def _transform(cls, surf, angle, size):
+        """return a rotated & scaled surface, shared by all sprites
+
+        Args:
+            surf (pygame.Surface): original costume
+            angle (int): rotate angle, clockwise
+            size (int): scale in percent
+
+        Returns:
+            pygame.Surface: Description
+        """
+        if cls._atlas_done:
+            cls._atlas_collect()
+        angle, atlas_key = cls._render_angle(surf, angle, size)
+        if atlas_key is not None:
+            new_surf = cls._transform_cache.get(atlas_key)
+            if new_surf is not None:
+                return new_surf
+        if angle == 0 and size == 100:
+            return surf
+        key = (surf, angle, size)
+        new_surf = cls._transform_cache.get(key)
+        if new_surf is None:
+            if angle and size != 100:
+                # rotate the cached scaled costume, only 1 transform
+                new_surf = cls._make_transform(
+                    cls._transform(surf, 0, size), angle, 100)
+            else:
+                new_surf = cls._make_transform(surf, angle, size)
+            cls._transform_cache.put(key, new_surf)
+        return new_surf
+
+    @classmethod
+    def _build_atlas(cls, surf, steps, size=100, threaded=False):
+        """pre-render rotated surfaces of a costume
+
+        Args:
+            surf (pygame.Surface): original costume
+            steps (int): count of rotate angles in 360 degrees
+            size (int, optional): scale in percent
+            threaded (bool, optional): render in a worker thread, the
+                cached rotate is used until the angle has been rendered
+
+        Returns:
+            threading.Thread: the worker, None if rendered already
+        """
+        if cls._rotate_atlas.get((surf, size)) == steps:
+            return None
+        cls._rotate_atlas[(surf, size)] = steps
+        if not threaded:
+            for i in range(steps):
+                cls._transform_cache.put(
+                    (surf, size, steps, i),
+                    cls._make_transform(surf, i * 360 / steps, size))
+            return None
+        # the costume is locked while rotated, so worker rotates a copy,
+        # rendered surfaces are saved into cache by main thread
+        src = surf.copy()
+        done = cls._atlas_done
+
+        def render():
+            for i in range(steps):
+                done.append(((surf, size, steps, i),
+                             cls._make_transform(src, i * 360 / steps, size)))
+
+        worker = threading.Thread(target=render, daemon=True)
+        worker.start()
+        return worker
+
+    @classmethod
+    def _atlas_collect(cls):
+        """save surfaces rendered by atlas worker into transform cache
+        """
+        done = cls._atlas_done
+        while done:
+            key, surf = done.pop(0)
+            cls._transform_cache.put(key, surf)
 
     def __rotate_n_scale(self):
         """Create a rotated surface"""
-        if self._rotate_angle != self._rotate_angle2:
-            # scale
-            rect_scale = self._size / 100
-            # rotate
-            angle = self._rotate_angle
-            arc = math.radians(angle)
-            org_rect = self._surf.get_rect()
-            org_rect = self._surf.get_rect()
-            new_w = int((abs(org_rect.width * math.cos(arc)) +
-                         abs(org_rect.height * math.sin(arc))) * rect_scale)
-            new_h = int((abs(org_rect.width * math.sin(arc)) +
-                         abs(org_rect.height * math.cos(arc))) * rect_scale)
-            new_surf = pygame.transform.rotate(self._surf, -angle)
-            new_surf = pygame.transform.scale(new_surf, (new_w, new_h))
-            self._rotate_surf = new_surf
-            self._rotate_angle2 = self._rotate_angle
+        key = (self._surf, self._rotate_angle, self._size)
+        if key != self._render_key:
+            self._rotate_surf = SpriteObj._transform(*key)
+            self._render_key = key
 
     # Looks Methods
     def __add_costume(self, image_surf, index=None):
         """
-        Insert 1 image surface object into costume list.
+        Insert 1 image surface object into costume list.
+
+        Args:
+          - image_surf (:obj:pygame.Surface): inserted image surface object
+          - index (int, optional): insert position, default as None.
+                None: means append the image surface and end of costume list
+
+        Returns:
+          - int: the image surface's position in list
+        """
+        self.__own_costume()
+        SpriteObj._image_cache.pin(image_surf)
+        num = len(self._costume)
+        if index:
+            self._costume.insert(index, image_surf)
+            if 0 <= index <= num:
+                return index
+            elif num < index:
+                return num
+            elif -num <= index < 0:
+                return num - index
+            else:
+                return 0
+        else:
+            self._costume.append(image_surf)
+            return num
+
+    def __own_costume(self):
+        """copy shared CostumeSet into own costume list before changing it
+        """
+        if isinstance(self._costume, CostumeSet):
+            self._costume = list(self._costume)
+            for surf in self._costume:
+                SpriteObj._image_cache.pin(surf)
+
+    def add_costume(self, image_file, index=None, rotations=0,
+                    threaded=False):
+        """
+        Insert one / a list images into costumes list
+
+        Args:
+          - image_file (str / list): one or a list of image file path or
+                surface, e.g. frames from load_sheet(). a CostumeSet is
+                shared by reference if sprite has no costume yet
+          - index (int, optional): insert position of images, default as None.
+                None means append the image at end of costumes list
+          - rotations (int, optional): pre-render rotated images in given
+                steps (e.g. 64 or 360) for sprite turning continuously,
+                default as 0 means rotate on demand
+          - threaded (bool, optional): pre-render in a worker thread
+
+        Returns:
+          - int: position of first added image in costumes list
+        """
+        if isinstance(image_file, CostumeSet):
+            if rotations:
+                for surf in image_file:
+                    SpriteObj._build_atlas(surf, rotations, self._size,
+                                           threaded)
+            if not self._costume:
+                self._costume = image_file
+                return 0
+            image_file = list(image_file)
+        flist = image_file if isinstance(image_file, list) else [image_file]
+        pos_list = []
+        for each in flist:
+            surf = each if isinstance(each, pygame.Surface) else \
+                SpriteObj.load_image(each)
+            if rotations:
+                SpriteObj._build_atlas(surf, rotations, self._size, threaded)
+            pos = self.__add_costume(surf, index)
+            pos_list.append(pos)
+            if index is not None:
+                index += 1
+        return pos_list[0]
+
+    def set_costume(self, image_file, index=None, rotations=0,
+                    threaded=False):
+        """
+        Insert one / a list images into costumes,
+        then switch the first image as current costum.
+
+        Args:
+          - image_file (str / list): one or a list of image file path or
+                surface, e.g. frames from load_sheet()
+          - index (int, optional): insert position of images, default as None.
+                None means append the image at end of costumes list
+          - rotations (int, optional): pre-render rotated images in given
+                steps, see add_costume()
+          - threaded (bool, optional): pre-render in a worker thread
+        """
+        index = self.add_costume(image_file, index, rotations, threaded)
+        self.switch_costume(index)
+
+    def del_costume(self, index=None):
+        """
+        delete a costume, default delete last one
+
+        Args:
+          - index (int, optional): the sequence of deleted costume
+
+        Returns:
+          - (Surface, optional): deleted Surface object
+        """
+        self.__own_costume()
+        if index:
+            surf = self._costume.pop(index)
+        else:
+            surf = self._costume.pop()
+        SpriteObj._image_cache.unpin(surf)
+        return surf
+
+    def _release(self):
+        """unpin cached images used by sprite, called once deleted
+        """
+        if not isinstance(self._costume, CostumeSet):
+            for surf in self._costume:
+                SpriteObj._image_cache.unpin(surf)
+        self._costume = []
+
+    def switch_costume(self, index):
+        """
+        Switch costumes to change the look of a sprite
+
+        Args:
+          - index (int): index in list
+        """
+        try:
+            self._surf = self._costume[index]
+            self._render_key = None  # force update
+            self._changed()
+            self._costume_used = index
+        except IndexError as err:
+            pass
+
+    def next_costume(self):
+        """
+        Switches to the next costume in the sprite's costume list
+        """
+        self._costume_used += 1
+        if self._costume_used >= len(self._costume):
+            self._costume_used = 0  # back to first costume
+        try:
+            self._surf = self._costume[self._costume_used]
+            self._render_key = None  # force update
+            self._changed()
+        except IndexError as err:
+            pass
+
+
+SpriteObj._image_cache.on_evict = SpriteObj._sheet_evicted
+
+
+class CostumeSet(tuple):
+    """immutable costume list, loaded once and shared by reference by all
+    sprites use it, see load_costume_set(). its images are always kept in
+    image cache
+
+    sprite only saves index of current costume, a sprite changing its
+    costume list (add_costume / del_costume) gets its own copy
+    """
+
+    def __new__(cls, images):
+        """Summary
+
+        Args:
+            images (list): image file path or surface list
+
+        Returns:
+            CostumeSet: Description
+        """
+        surfs = [each if isinstance(each, pygame.Surface) else
+                 SpriteObj.load_image(each) for each in images]
+        for surf in surfs:
+            SpriteObj._image_cache.pin(surf)
+        return super().__new__(cls, surfs)
+
+
+class TileLayer(SpriteObj):
+    """Sprite Object shows a grid of tiles from a shared tileset,
+    e.g. game board
+
+    tile indexes are saved in a compact array. only the part of layer in
+    screen is cached as a surface, and only changed tiles are re-drawn on
+    it. tile layer is not rotated or scaled
+
+    Attributes:
+        - cols (int): count of tiles in a row
+        - rows (int): count of tiles in a column
+        - tile_w (int): tile width in pixel
+        - tile_h (int): tile height in pixel
+
+    Methods:
+        - set_tile(x, y, idx): set tileset index of a cell, -1 for empty
+        - get_tile(x, y): get tileset index of a cell
+        - cell_at(x, y): get (x, y) of cell which covers pixel position
+        - cell_pos(x, y): get pixel position of cell center
+    """
+
+    def __init__(self, name, tiles, cols=1, rows=1, pos=(0, 0), fill=0):
+        """Summary
+
+        Args:
+            name (str): Description
+            tiles (list): tileset, image file path or surface of tiles
+            cols (int, optional): count of tiles in a row
+            rows (int, optional): count of tiles in a column
+            pos (tuple, optional): top-left position of layer
+            fill (int, optional): init tileset index of all cells
+
+        Raises:
+            IndexError: fill out of tileset
+        """
+        tiles = [SpriteObj.load_image(each) if isinstance(each, str)
+                 else each for each in tiles]
+        if not -1 <= fill < len(tiles):
+            raise IndexError('tile index %d out of tileset' % fill)
+        super().__init__(name)
+        self._tiles = tiles
+        for tile in self._tiles:
+            SpriteObj._image_cache.pin(tile)
+        self.tile_w, self.tile_h = self._tiles[0].get_size()
+        self.cols = cols
+        self.rows = rows
+        self._cells = array('h', [fill]) * (cols * rows)
+        self._view_surf = None  # cached part of layer in screen
+        self._view_rect = None  # screen area of _view_surf
+        self._view_key = None  # (view, left, top) of _view_surf
+        self.set_pos(pos[0] + cols * self.tile_w // 2,
+                     pos[1] + rows * self.tile_h // 2)
+
+    @property
+    def left(self):
+        """x of layer left edge (int)"""
+        return int(self._vpos[0]) - self.cols * self.tile_w // 2
+
+    @property
+    def top(self):
+        """y of layer top edge (int)"""
+        return int(self._vpos[1]) - self.rows * self.tile_h // 2
+
+    @property
+    def size_w(self):
+        return self.cols * self.tile_w
+
+    @property
+    def size_h(self):
+        return self.rows * self.tile_h
+
+    def _make_bound(self):
+        """return the rect of whole layer
+
+        Returns:
+            pygame.Rect: Description
+        """
+        return pygame.Rect(self.left, self.top, self.size_w, self.size_h)
+
+    def in_pos(self, xy_or_x, y=None):
+        """check if layer cover given position
+
+        Args:
+            - xy_or_x (tuple/int): Description
+            - y (int, optional): Description
+
+        Returns:
+            - bool: return True if layer at position
+        """
+        return not self._hidden and self.cell_at(xy_or_x, y) is not None
+
+    def get_tile(self, x, y, defval=None):
+        """return tileset index of a cell, -1 for empty
+
+        Args:
+            x (int): column of cell
+            y (int): row of cell
+            defval (None, optional): return it if cell out of layer
+
+        Returns:
+            int: Description
+        """
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return self._cells[y * self.cols + x]
+        return defval
+
+    def set_tile(self, x, y, idx):
+        """set tileset index of a cell, and re-draw the cell if in screen
+
+        Args:
+            x (int): column of cell
+            y (int): row of cell
+            idx (int): index in tileset, -1 for empty
+
+        Raises:
+            IndexError: cell out of layer, or idx out of tileset
+        """
+        if not (0 <= x < self.cols and 0 <= y < self.rows):
+            raise IndexError('cell (%d, %d) out of tile layer' % (x, y))
+        if not -1 <= idx < len(self._tiles):
+            raise IndexError('tile index %d out of tileset' % idx)
+        i = y * self.cols + x
+        if self._cells[i] == idx:
+            return
+        self._cells[i] = idx
+        if self._view_surf is None:
+            return
+        # draw at layer position of cached view, it is re-rendered anyway
+        # once layer moved
+        _, left, top = self._view_key
+        rect = pygame.Rect(left + x * self.tile_w, top + y * self.tile_h,
+                           self.tile_w, self.tile_h)
+        if not rect.colliderect(self._view_rect):
+            return
+        view_left, view_top = self._view_rect.topleft
+        rect_in_view = rect.move(-view_left, -view_top)
+        self._view_surf.fill((0, 0, 0, 0), rect_in_view)
+        if idx >= 0:
+            self._view_surf.blit(self._tiles[idx], rect_in_view)
+        if self._blit_rect is not None:
+            SpriteObj._dirty_areas.append(rect.clip(self._view_rect))
+
+    def cell_at(self, xy_or_x, y=None):
+        """return (x, y) of cell which covers pixel position
 
         Args:
-          - image_surf (:obj:pygame.Surface): inserted image surface object
-          - index (int, optional): insert position, default as None.
-                None: means append the image surface and end of costume list
+            xy_or_x (tuple/int): Description
+            y (int, optional): Description
 
         Returns:
-          - int: the image surface's position in list
+            tuple: None if position out of layer
         """
-        num = len(self._costume)
-        if index:
-            self._costume.insert(index, image_surf)
-            if 0 <= index <= num:
-                return index
-            elif num < index:
-                return num
-            elif -num <= index < 0:
-                return num - index
-            else:
-                return 0
-        else:
-            self._costume.append(image_surf)
-            return num
+        pos = xy_or_x if y is None else (xy_or_x, y)
+        x = int((pos[0] - self.left) // self.tile_w)
+        y = int((pos[1] - self.top) // self.tile_h)
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return (x, y)
+        return None
 
-    def add_costume(self, image_file, index=None):
-        """
-        Insert one / a list images into costumes list
+    def cell_pos(self, x, y):
+        """return pixel position of cell center
 
         Args:
-          - image_file (str / list): one or a list of image file path
-          - index (int, optional): insert position of images, default as None.
-                None means append the image at end of costumes list
+            x (int): column of cell
+            y (int): row of cell
 
         Returns:
-          - int: position of first added image in costumes list
+            tuple: Description
         """
-        flist = image_file if isinstance(image_file, list) else [image_file]
-        pos_list = []
-        for each in flist:
-            surf = SpriteObj.load_image(each)
-            pos = self.__add_costume(surf, index)
-            pos_list.append(pos)
-            if index is not None:
-                index += 1
-        return pos_list[0]
+        return (self.left + x * self.tile_w + self.tile_w // 2,
+                self.top + y * self.tile_h + self.tile_h // 2)
 
-    def set_costume(self, image_file, index=None):
+    def _release(self):
+        """unpin cached tile images, called once deleted
         """
-        Insert one / a list images into costumes,
-        then switch the first image as current costum.
+        super()._release()
+        for tile in self._tiles:
+            SpriteObj._image_cache.unpin(tile)
+
+    def _update(self):
+        """save the cached part of layer in screen to be drawn,
+        re-draw all tiles in it only if layer moved or screen resized
+        """
+        self._blit_surf = None
+        self._blit_rect = None
+        if self._hidden:
+            return
+        left, top = self.left, self.top
+        view = pygame.Rect(left, top, self.size_w, self.size_h).clip(
+            SpriteObj._screen_rect)
+        if not view.width or not view.height:
+            return
+        if (view, left, top) != self._view_key:
+            self.__render_view(view, left, top)
+        self._blit_surf = self._view_surf
+        self._blit_rect = self._view_rect
+
+    def __render_view(self, view, left, top):
+        """draw all tiles of layer in given screen area
 
         Args:
-          - image_file (str / list): one or a list of image file path
-          - index (int, optional): insert position of images, default as None.
-                None means append the image at end of costumes list
+            view (pygame.Rect): screen area
+            left (int): x of layer left edge
+            top (int): y of layer top edge
         """
-        index = self.add_costume(image_file, index)
-        self.switch_costume(index)
+        tile_w, tile_h = self.tile_w, self.tile_h
+        x0 = (view.left - left) // tile_w
+        x1 = (view.right - 1 - left) // tile_w
+        y0 = (view.top - top) // tile_h
+        y1 = (view.bottom - 1 - top) // tile_h
+        surf = pygame.Surface(view.size, SRCALPHA)
+        blits = []
+        for y in range(y0, y1 + 1):
+            row = y * self.cols
+            pos_y = top + y * tile_h - view.top
+            for x in range(x0, x1 + 1):
+                idx = self._cells[row + x]
+                if idx >= 0:
+                    blits.append((self._tiles[idx],
+                                  (left + x * tile_w - view.left, pos_y)))
+        surf.blits(blits, doreturn=False)
+        self._view_surf = surf
+        self._view_rect = view
+        self._view_key = (view, left, top)
+
+
+class Preloader(object):
+    """decode image files in a thread pool, convert them to display format
+    in main thread by run(), see preload()
 
-    def del_costume(self, index=None):
+    Attributes:
+        - total (int): count of image files
+        - loaded (int): count of converted image files
+        - progress (float): 0.0 ~ 1.0
+        - done (bool): True if all image files loaded
+        - errors (list): exceptions of failed image files
+        - future (concurrent.futures.Future): set result as Preloader self
+            when done, or exception if any image file failed
+
+    Methods:
+        - update(): convert decoded images, called by run()
+        - wait(): block until all image files loaded
+    """
+
+    def __init__(self, image_files, workers=4, alpha=False, callback=None):
+        """Summary
+
+        Args:
+            image_files (list): image file path list
+            workers (int, optional): count of decode threads
+            alpha (bool, optional): Description
+            callback (function, optional): callback(preloader) in main thread
+                when done
         """
-        delete a costume, default delete last one
+        super().__init__()
+        files = [each for each in dict.fromkeys(image_files)
+                 if SpriteObj._image_key(each, alpha)
+                 not in SpriteObj._image_cache]
+        self.total = len(files)
+        self.loaded = 0
+        self.errors = []
+        self.future = Future()
+        self._alpha = alpha
+        self._callback = callback
+        self._pending = []  # (image file, decode future)
+        if files:
+            pool = ThreadPoolExecutor(max_workers=max(1, workers))
+            self._pending = [(each, pool.submit(pygame.image.load, each))
+                             for each in files]
+            pool.shutdown(wait=False)
+        self.update()
+
+    @property
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return not self._pending
+
+    def update(self, block=False):
+        """convert decoded images to display format, must be called in
+        main thread
 
         Args:
-          - index (int, optional): the sequence of deleted costume
+            block (bool, optional): wait for all decoding
 
         Returns:
-          - (Surface, optional): deleted Surface object
+            bool: True if all image files loaded
         """
-        if index:
-            return self._costume.pop(index)
+        if self.future.done():
+            return True
+        pending = []
+        for image_file, decoding in self._pending:
+            if not block and not decoding.done():
+                pending.append((image_file, decoding))
+                continue
+            try:
+                SpriteObj._convert_image(image_file, decoding.result(),
+                                         self._alpha)
+            except Exception as err:
+                self.errors.append(err)
+            self.loaded += 1
+        self._pending = pending
+        if pending:
+            return False
+        if self.errors:
+            self.future.set_exception(self.errors[0])
         else:
-            return self._costume.pop()
+            self.future.set_result(self)
+        if self._callback:
+            self._callback(self)
+        return True
 
-    def switch_costume(self, index):
-        """
-        Switch costumes to change the look of a sprite
+    def wait(self):
+        """block until all image files loaded
 
-        Args:
-          - index (int): index in list
+        Returns:
+            Preloader: self
         """
-        try:
-            self._surf = self._costume[index]
-            self._rotate_angle2 = None # force update
-            self._costume_used = index
-        except IndexError as err:
-            pass
+        self.update(block=True)
+        return self
 
-    def next_costume(self):
-        """
-        Switches to the next costume in the sprite's costume list
-        """
-        self._costume_used += 1
-        if self._costume_used >= len(self._costume):
-            self._costume_used = 0  # back to first costume
-        try:
-            self._surf = self._costume[self._costume_used]
-            self._rotate_angle2 = None # force update
-        except IndexError as err:
-            pass
+
+def _bar_property(name, doc):
+    """create a SpriteBar property which marks the bar to be re-rendered
+
+    Args:
+        name (str): attribute name
+        doc (str): property docstring
+
+    Returns:
+        property: Description
+    """
+    attr = '_bar_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._bar_changed = True
+
+    return property(fget, fset, doc=doc)
 
 
 class SpriteBar(SpriteObj):
+    """Sprite Object shows a value bar, e.g. health bar
+
+    the bar surface is only re-rendered when its value, limits, size or
+    colors changed, bars look same share one surface
+    """
+    _bar_cache = SurfaceCache(4 * 1024 * 1024)  # rendered bar surfaces
+
+    value = _bar_property('value', 'current value (int)')
+    val_max = _bar_property('val_max', 'value of full bar (int)')
+    val_min = _bar_property('val_min', 'value of empty bar (int)')
+    bar_width = _bar_property('bar_width', 'bar width in pixel (int)')
+    bar_height = _bar_property('bar_height', 'bar height in pixel (int)')
+    front_color = _bar_property('front_color', 'bar color (str/tuple)')
+    back_color = _bar_property('back_color', 'background color (str/tuple)')
+    border_color = _bar_property('border_color', 'border color (str/tuple)')
+    border = _bar_property('border', 'border width in pixel (int)')
 
     def __init__(self, name='', value=100, max=100, min=0, width=64, height=10,
                  front_color='red', back_color='black', border_color='white',
                  front_color2=None):
         super().__init__(name)
+        self._bar_changed = True
         self.value = value
         self.val_max = max
         self.val_min = min
@@ -663,20 +2254,38 @@ class SpriteBar(SpriteObj):
         self.border = 1
 
     def _update(self):
+        if self._bar_changed:
+            self._surf = self.__render_bar()
+            self._bar_changed = False
+            self._changed()
+        super()._update()
+
+    def __render_bar(self):
+        """return bar surface from cache, render it if not found
+
+        Returns:
+            pygame.Surface: Description
+        """
         fc = Color(self.front_color) if isinstance(
             self.front_color, str) else Color(*self.front_color)
         bc = Color(self.back_color) if isinstance(
             self.back_color, str) else Color(*self.back_color)
         dc = Color(self.border_color) if isinstance(
             self.border_color, str) else Color(*self.border_color)
-        self._surf = pygame.Surface((self.bar_width, self.bar_height))
-        bg_rect = self._surf.fill(bc)
-        bar_rect = bg_rect.copy()
-        bar_rect.width = bg_rect.width * \
-            ((self.value - self.val_min) / (self.val_max - self.val_min))
-        pygame.draw.rect(self._surf, fc, bar_rect, 0)
-        pygame.draw.rect(self._surf, dc, bg_rect, self.border)
-        super()._update()
+        ratio = (self.value - self.val_min) / (self.val_max - self.val_min)
+        bar_w = int(self.bar_width * min(max(ratio, 0), 1))
+        key = (tuple(fc), tuple(bc), tuple(dc), self.bar_width,
+               self.bar_height, self.border, bar_w)
+        surf = SpriteBar._bar_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((self.bar_width, self.bar_height))
+            bg_rect = surf.fill(bc)
+            bar_rect = bg_rect.copy()
+            bar_rect.width = bar_w
+            pygame.draw.rect(surf, fc, bar_rect, 0)
+            pygame.draw.rect(surf, dc, bg_rect, self.border)
+            SpriteBar._bar_cache.put(key, surf)
+        return surf
 
 
 def set_event(name_or_id, func=None):
@@ -705,6 +2314,8 @@ def set_event(name_or_id, func=None):
     Raises:
         ValueError: Description
     """
+    if not this.__event_dict:
+        __init_event()
     helpmsg = ''
     for eid, name in this.__event_dict.items():
         helpmsg += '\n\t%2d: %s' % (eid, name)
@@ -831,19 +2442,54 @@ __run_fps.frame_sum = 0
 __run_fps.last_time = 0
 
 
-def run():
-    """waiting event from screen
+def run(fps=None, timestep=None, step=None):
+    """simulate and refresh screen once, then waiting event from screen
+
+    Args:
+        fps (int, optional): max frames per second, 0 means not limited.
+            default as 100, or 0 in headless mode set by set_headless()
+            or SCREEN_HEADLESS=1
+        timestep (int, optional): fixed simulation step in milliseconds,
+            auto-move sprites move once per step, multiple steps may run to
+            catch up a slow frame. default as None means one step per frame
+        step (function, optional): game logic called once per simulation
+            step after auto-move sprites moved, e.g. move and collide, so
+            it keeps real-time speed when frame rate drops
 
     Returns:
-        TYPE: Description
+        int: milliseconds of the frame, steps run is saved in sim_steps
     """
+    _lazy_init()
+    __update_preload()
+    # simulation
+    if timestep is None:
+        steps = 1
+    else:
+        this.__sim_time += this.__frame_msec
+        steps = int(this.__sim_time // timestep)
+        this.__sim_time -= steps * timestep
+        # drop steps which can not catch up
+        steps = min(steps, this.max_sim_steps)
+    for i in range(steps):
+        SpriteObj._step_all()
+        if step is not None:
+            SpriteObj._am_sync()
+            step()
+    SpriteObj._am_sync()
+    this.sim_steps = steps
     # refresh screen
-    __update_background()
-    __update_sprites()
-    __update_status_bar()
-    pygame.display.update()
+    if this.dirty_rect and not __backdrop_changed():
+        rects = SpriteObj._update_all(__clear_background)
+        rects += __update_status_bar(rects)
+        pygame.display.update(rects)
+    else:
+        __update_background()
+        __update_sprites()
+        __update_status_bar()
+        pygame.display.update()
     # release cpu
-    msec = __run_fps(100)
+    msec = __run_fps(this.__frame_rate if fps is None else fps)
+    this.__frame_msec = msec
     # event handle
     __update_key_mouse()
     for event in pygame.event.get():
@@ -854,28 +2500,71 @@ def run():
     return msec
 
 
-def __update_status_bar():
-    """Summary
+def __update_status_bar(areas=None):
+    """draw status bar, only re-render it if text changed
+
+    Args:
+        areas (list, optional): changed area (Rect) on screen in dirty-rect
+            mode, None means whole screen has been re-drawn
+
+    Returns:
+        list: changed area (Rect) on screen
+    """
+    if not this.status_bar:
+        return []
+    fields = (('fps=', '%d' % this.fps),
+              (' x=', '%d' % this.mouse_pos[0]),
+              (' y=', '%d' % this.mouse_pos[1]),
+              (' btn=', this.mouse_btn),
+              (' key=', '+'.join(this.keys)))
+    if this.__font_obj is None:
+        this.__font_obj = pygame.font.SysFont(this.__font_family,
+                                              this.__font_size)
+    screen_width, screen_height = this.size
+    font_height = this.__font_obj.get_linesize()
+    bar_rect = pygame.Rect(0, screen_height - font_height,
+                           screen_width, font_height)
+    if this.__status_fields != fields or this.__status_surf is None or \
+            this.__status_surf.get_size() != bar_rect.size:
+        this.__status_surf = __render_status_bar(fields, bar_rect.size)
+        this.__status_fields = fields
+    elif areas is not None and bar_rect.collidelist(areas) < 0:
+        return []  # not changed and not covered
+    this.__screen.blit(this.__status_surf, bar_rect)
+    return [bar_rect]
+
+
+def __render_status_bar(fields, size):
+    """render status bar text, label and value glyphs are cached
+
+    Args:
+        fields (tuple): (label, value) text pairs
+        size (tuple): status bar width and height
+
+    Returns:
+        pygame.Surface: Description
     """
-    if this.status_bar:
-        status_text = "fps=%d x=%d y=%d btn=%s key=%s" % (this.fps,
-                                                        *this.mouse_pos,
-                                                        this.mouse_btn,
-                                                        '+'.join(this.keys))
-        screen_width, screen_height = this.size
-        font_height = this.__font_obj.get_linesize()
-        font_color = (255, 200, 0)  # orange
-        font_bgcolor = (0, 0, 0)  # black
-        # clean old text
-        font_surf = pygame.Surface((screen_width, font_height))
-        font_rect = font_surf.fill(font_bgcolor).move(
-            0, screen_height - font_height)
-        this.__screen.blit(font_surf, font_rect)
-        # print(status_text)
-        font_surf = this.__font_obj.render(
-            status_text, True, font_color, font_bgcolor)
-        font_rect = font_surf.get_rect().move(0, screen_height - font_height)
-        this.__screen.blit(font_surf, font_rect)
+    font_color = (255, 200, 0)  # orange
+    font_bgcolor = (0, 0, 0)  # black
+    surf = pygame.Surface(size)
+    surf.fill(font_bgcolor)
+    x = 0
+    for label, value in fields:
+        label_surf = this.__status_labels.get(label)
+        if label_surf is None:
+            label_surf = this.__font_obj.render(
+                label, True, font_color, font_bgcolor)
+            this.__status_labels[label] = label_surf
+        old_value, value_surf = this.__status_values.get(label, (None, None))
+        if old_value != value:
+            value_surf = this.__font_obj.render(
+                value, True, font_color, font_bgcolor)
+            this.__status_values[label] = (value, value_surf)
+        surf.blit(label_surf, (x, 0))
+        x += label_surf.get_width()
+        surf.blit(value_surf, (x, 0))
+        x += value_surf.get_width()
+    return surf
 
 
 def __update_sprites():
@@ -887,14 +2576,55 @@ def __update_sprites():
 def __update_background():
     """Summary
     """
+    surf = __compose_backdrop()
+    if surf:
+        this.__screen.blit(surf, (0, 0))
+    this.__backdrop_drawn = (surf, this.size)
+
+
+def __compose_backdrop():
+    """tile the backdrop costume into one screen size surface,
+    only re-compose if backdrop or screen size changed
+
+    Returns:
+        pygame.Surface: composed backdrop, None if no backdrop
+    """
     obj = get_sprite('__backdrop__')
-    if obj and obj._surf:
-        backdrop_heigth = obj._surf.get_height()
-        backdrop_width = obj._surf.get_width()
-        screen_width, screen_height = this.size
-        for y in range(0, screen_height, backdrop_heigth):
-            for x in range(0, screen_width, backdrop_width):
-                this.__screen.blit(obj._surf, (x, y))
+    surf = obj._surf if obj else None
+    key = (surf, this.size)
+    if this.__backdrop_key != key:
+        this.__backdrop_key = key
+        this.__backdrop_surf = None
+        if surf:
+            backdrop_heigth = surf.get_height()
+            backdrop_width = surf.get_width()
+            screen_width, screen_height = this.size
+            composed = pygame.Surface(this.size).convert()
+            for y in range(0, screen_height, backdrop_heigth):
+                for x in range(0, screen_width, backdrop_width):
+                    composed.blit(surf, (x, y))
+            this.__backdrop_surf = composed
+    return this.__backdrop_surf
+
+
+def __backdrop_changed():
+    """return True if whole screen should be re-drawn
+    """
+    return this.__backdrop_drawn != (__compose_backdrop(), this.size)
+
+
+def __clear_background(scr, rect):
+    """re-draw backdrop in the given area of screen
+
+    Args:
+        scr (pygame.Surface): screen surface
+        rect (pygame.Rect): the area to re-draw
+    """
+    surf = __compose_backdrop()
+    if surf:
+        scr.blit(surf, rect, rect)
+    else:
+        scr.fill((0, 0, 0), rect)
 
 
 def get_backdrop():
@@ -917,6 +2647,7 @@ def set_backdrop(image_file, index=None):
     obj = get_backdrop()
     index = obj.add_costume(image_file, index)
     obj.switch_costume(index)
+    __compose_backdrop()
 
 
 def add_backdrop(image_file, index=None):
@@ -940,7 +2671,9 @@ def del_backdrop(index=None):
     Returns:
         TYPE: Description
     """
-    return get_backdrop().del_costume(index)
+    surf = get_backdrop().del_costume(index)
+    __compose_backdrop()
+    return surf
 
 
 def switch_backdrop(index):
@@ -951,6 +2684,7 @@ def switch_backdrop(index):
         index (TYPE): Description
     """
     get_backdrop().switch_costume(index)
+    __compose_backdrop()
 
 
 def next_backdrop():
@@ -958,6 +2692,7 @@ def next_backdrop():
     Switches to the next backdrop in the sprite's backdrop list
     """
     get_backdrop().next_costume()
+    __compose_backdrop()
 
 
 def _load_image(image_file, alpha=False):
@@ -976,6 +2711,72 @@ def _load_image(image_file, alpha=False):
     return SpriteObj.load_image(image_file, alpha)
 
 
+def preload(image_files, workers=4, alpha=False, callback=None):
+    """
+    load image files in background, decode in a thread pool, and convert
+    to display format by run() in main thread, so loading screen keeps
+    running in full fps
+
+    Args:
+        image_files (list): image file path list
+        workers (int, optional): count of decode threads
+        alpha (bool, optional): Description
+        callback (function, optional): callback(preloader) when done
+
+    Returns:
+        Preloader: check its progress / done, or wait for its future
+    """
+    _lazy_init()
+    loader = Preloader(image_files, workers, alpha, callback)
+    if not loader.future.done():
+        this.__preloaders.append(loader)
+    return loader
+
+
+def __update_preload():
+    """convert decoded images of preload()
+    """
+    if this.__preloaders:
+        this.__preloaders = [loader for loader in this.__preloaders
+                             if not loader.update()]
+
+
+def load_costume_set(images):
+    """
+    return a CostumeSet shared by all sprites use the same image list,
+    images are loaded only at first time
+
+    Args:
+        images (list): image file path or surface list
+
+    Returns:
+        CostumeSet: use it in set_costume() or create_sprite()
+    """
+    key = tuple(images)
+    costumes = this.__costume_sets.get(key)
+    if costumes is None:
+        costumes = CostumeSet(images)
+        this.__costume_sets[key] = costumes
+    return costumes
+
+
+def load_sheet(image_file, grid=None, frames=None, alpha=False):
+    """
+    load a sprite sheet and cut it into costume frames,
+    see SpriteObj.load_sheet()
+
+    Args:
+        image_file (str): sprite sheet image file path
+        grid (tuple, optional): (cols, rows) of same size frames
+        frames (str/dict, optional): rect map, json file path or dict
+        alpha (bool, optional): Description
+
+    Returns:
+        list / dict: frame surfaces
+    """
+    return SpriteObj.load_sheet(image_file, grid, frames, alpha)
+
+
 def get_sprite(name, defval=None):
     """return found SpriteObj, by name. return None for no found
 
@@ -1024,23 +2825,28 @@ def draw_box(width, height, color, bgcolor, border=0):
     bc = Color(bgcolor) if isinstance(bgcolor, str) else Color(*bgcolor)
     obj = SpriteObj()
     obj._surf = pygame.Surface((width, height))
+    obj._changed()
     obj._rect = pygame.draw.rect(obj._surf, fc, obj._surf.fill(bc), border)
     return obj
 
 
-def create_sprite(name, owner=None, images=None, xy_or_x=None, y=None):
+def create_sprite(name, owner=None, images=None, xy_or_x=None, y=None,
+                  group=None):
     """create a SpriteObj with a name
 
     Args:
     - name (str): unique name, support auto-name which end with 'XXXXXX'
     - owner (obj, optional): set owner for sprite, used for get owner if has sprite
-    - images (str/list, optional): init the costume from image file path / file list
+    - images (str/list, optional): init the costume from image file path / file list,
+        or a shared CostumeSet from load_costume_set()
     - xy (tuple): position (x,y)
     - x, y (int, optional): position x & y
+    - group (str/list, optional): add sprite into one / a list of groups
 
     Returns:
     - obj: create SpriteObj
     """
+    _lazy_init()
     obj = SpriteObj(name)
     if owner is not None:
         obj.set_owner(owner)
@@ -1049,9 +2855,34 @@ def create_sprite(name, owner=None, images=None, xy_or_x=None, y=None):
     if xy_or_x is not None:
         pos = xy_or_x if y is None else (xy_or_x, y)
         obj.move_to(pos)
+    if group is not None:
+        for each in (group if isinstance(group, list) else [group]):
+            obj.add_group(each)
     return obj
 
 
+def create_tile_layer(name, tiles, cols, rows, xy_or_x=None, y=None,
+                      fill=0):
+    """create a TileLayer with a name
+
+    Args:
+    - name (str): unique name, support auto-name which end with 'XXXXXX'
+    - tiles (list): tileset, image file path or surface of tiles
+    - cols, rows (int): count of tiles in a row and a column
+    - xy (tuple, optional): top-left position (x,y), default as (0, 0)
+    - x, y (int, optional): top-left position x & y
+    - fill (int, optional): init tileset index of all cells, -1 for empty
+
+    Returns:
+    - obj: created TileLayer
+    """
+    _lazy_init()
+    pos = (0, 0)
+    if xy_or_x is not None:
+        pos = xy_or_x if y is None else (xy_or_x, y)
+    return TileLayer(name, tiles, cols, rows, pos, fill)
+
+
 def delete_sprite(obj):
     """delete sprite object
 
@@ -1081,7 +2912,129 @@ def set_size(width, height):
         height (TYPE): Description
     """
     this.size = (width, height)
+    SpriteObj._screen_rect = pygame.Rect((0, 0), this.size)
+    if this.__screen is None:
+        init()  # open window in given size at first time
+        return
+    this.__screen = pygame.display.set_mode(this.size, 0, 32)
+    this.__backdrop_drawn = None  # force re-draw whole screen
+    __compose_backdrop()
+
+
+def set_transform_cache(max_bytes, rotate_step=1):
+    """config the rotated & scaled surface cache shared by all sprites
+
+    Args:
+        max_bytes (int): memory budget in bytes, 0 means no limit
+        rotate_step (int, optional): rotate angle is rounded to multiple of
+            it, bigger step means less surfaces in cache
+    """
+    SpriteObj._rotate_step = max(1, int(rotate_step))
+    SpriteObj._transform_cache.max_bytes = max_bytes
+    SpriteObj._transform_cache.evict()
+
+
+def set_image_cache(max_bytes):
+    """config memory budget of loaded image cache, images used by sprites
+    are never evicted
+
+    Args:
+        max_bytes (int): memory budget in bytes, 0 means no limit
+    """
+    SpriteObj._image_cache.max_bytes = max_bytes
+    SpriteObj._image_cache.evict()
+
+
+def cache_info():
+    """return counters (count, bytes, max_bytes, hits, misses, pinned)
+    of image cache and transform cache
+
+    Returns:
+        dict: {'image': dict, 'transform': dict}
+    """
+    return {'image': SpriteObj._image_cache.info(),
+            'transform': SpriteObj._transform_cache.info()}
+
+
+def add_layer(name, order):
+    """add a named sprite layer, layers with bigger order drawn in front.
+    the 'default' layer order is 0
+
+    Args:
+        name (str): layer name
+        order (int): draw order of layer
+    """
+    SpriteObj._layers[name] = order
+    # re-sort draw list as layer order may changed
+    draw_list = SpriteObj._draw_list
+    for i, (_, z, oid, obj) in enumerate(draw_list):
+        obj._draw_key = (SpriteObj._layers[obj._layer], z, oid, obj)
+        draw_list[i] = obj._draw_key
+    draw_list.sort()
+
+
+def init(size=None, font=None, headless=None):
+    """init pygame and open window. it is called automatically by the first
+    set_size(), run(), create_sprite() or image loading, call it explicitly
+    to choose the options
+
+    Args:
+        size (tuple, optional): screen (width, height), default as (800, 600)
+        font (tuple, optional): status bar font (family, size),
+            font is loaded at first status bar drawing
+        headless (bool, optional): render in memory without window,
+            see set_headless()
+    """
+    if size is not None:
+        this.size = tuple(size)
+        SpriteObj._screen_rect = pygame.Rect((0, 0), this.size)
+    if font is not None:
+        this.__font_family, this.__font_size = font
+        this.__font_obj = None
+        this.__status_fields = None
+        this.__status_labels = {}
+        this.__status_values = {}
+    if headless and not this.headless:
+        set_headless()
+    if this.__screen is not None:
+        set_size(*this.size)
+        return
+    if this.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.init()
+    this.headless = pygame.display.get_driver() in ('dummy', 'offscreen')
     this.__screen = pygame.display.set_mode(this.size, 0, 32)
+    this.__clock = pygame.time.Clock()
+    this.__backdrop_drawn = None  # force re-draw whole screen
+    pygame.display.set_caption(this.__caption)
+
+
+def _lazy_init():
+    """init pygame and open window if not yet"""
+    if this.__screen is None:
+        init()
+
+
+def set_headless(frame_rate=0):
+    """render into an in-memory screen without window (SDL dummy driver),
+    for running on server or CI without display. same as set environment
+    variable SCREEN_HEADLESS=1 before import screen
+
+    Args:
+        frame_rate (int, optional): max frames per second of run(),
+            default as 0 means not limited
+    """
+    this.__frame_rate = frame_rate
+    if this.headless:
+        return
+    this.headless = True
+    if this.__screen is None:
+        return  # selected driver when init()
+    pygame.display.quit()
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    this.__screen = None
+    init()
 
 
 def set_caption(caption):
@@ -1091,7 +3044,9 @@ def set_caption(caption):
         caption (TYPE): Description
     """
     if caption and isinstance(caption, str):
-        pygame.display.set_caption(caption)
+        this.__caption = caption
+        if this.__screen is not None:
+            pygame.display.set_caption(caption)
 
 
 def __init_event():
@@ -1117,6 +3072,229 @@ def now_time():
     return pygame.time.get_ticks()
 
 
+def group(name):
+    """return SpriteObj list of a group, see create_sprite()
+
+    Args:
+        name (str): group name
+
+    Returns:
+        list: SpriteObj in order of joining group
+    """
+    objs = SpriteObj._groups.get(name)
+    return list(objs.values()) if objs else []
+
+
+def collide_groups(group_a, group_b):
+    """find all overlapped sprite pairs between 2 groups in one pass,
+    vectorized by numpy if installed, otherwise sweep-and-prune
+
+    Args:
+        group_a (str/list): group name or SpriteObj list
+        group_b (str/list): group name or SpriteObj list
+
+    Returns:
+        list: (index in group_a, index in group_b) pairs, the index is
+            position in list of group(name) or given list
+    """
+    objs_a = group(group_a) if isinstance(group_a, str) else group_a
+    objs_b = group(group_b) if isinstance(group_b, str) else group_b
+    rects_a = [(i, obj._sense_rect()) for i, obj in enumerate(objs_a)]
+    rects_b = [(j, obj._sense_rect()) for j, obj in enumerate(objs_b)]
+    rects_a = [(i, rect) for i, rect in rects_a if rect is not None]
+    rects_b = [(j, rect) for j, rect in rects_b if rect is not None]
+    if not rects_a or not rects_b:
+        return []
+    if np is not None and len(rects_a) * len(rects_b) > 4096:
+        return __collide_rects_numpy(rects_a, rects_b)
+    return __collide_rects_sweep(rects_a, rects_b)
+
+
+def __collide_rects_numpy(rects_a, rects_b):
+    """find overlapped rect pairs by numpy, rects of group b are sorted by
+    left, candidates of each rect of group a are found by binary search,
+    then tested together
+
+    Args:
+        rects_a (list): (index, Rect) pairs
+        rects_b (list): (index, Rect) pairs
+
+    Returns:
+        list: (index a, index b) pairs
+    """
+    index_a = np.array([i for i, _ in rects_a])
+    index_b = np.array([j for j, _ in rects_b])
+    box_a = np.array([rect for _, rect in rects_a])  # (x, y, w, h)
+    box_a[:, 2:] += box_a[:, :2]  # (left, top, right, bottom)
+    box_b = np.array([rect for _, rect in rects_b])
+    box_b[:, 2:] += box_b[:, :2]
+    order = np.argsort(box_b[:, 0], kind='stable')
+    box_b = box_b[order]
+    index_b = index_b[order]
+    # rect b may overlap rect a only if a.left - max width < b.left < a.right
+    max_w = int((box_b[:, 2] - box_b[:, 0]).max())
+    lo = np.searchsorted(box_b[:, 0], box_a[:, 0] - max_w, side='right')
+    hi = np.searchsorted(box_b[:, 0], box_a[:, 2], side='left')
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    if not total:
+        return []
+    cand_a = np.repeat(np.arange(len(box_a)), counts)
+    starts = np.cumsum(counts) - counts
+    cand_b = np.arange(total) - np.repeat(starts - lo, counts)
+    a, b = box_a[cand_a], box_b[cand_b]
+    hit = ((a[:, 0] < b[:, 2]) & (a[:, 2] > b[:, 0]) &
+           (a[:, 1] < b[:, 3]) & (a[:, 3] > b[:, 1]))
+    pairs = np.stack((index_a[cand_a[hit]], index_b[cand_b[hit]]), axis=1)
+    return sorted(map(tuple, pairs.tolist()))
+
+
+def __collide_rects_sweep(rects_a, rects_b):
+    """find overlapped rect pairs by sweep-and-prune on x axis
+
+    Args:
+        rects_a (list): (index, Rect) pairs
+        rects_b (list): (index, Rect) pairs
+
+    Returns:
+        list: (index a, index b) pairs
+    """
+    items = [(rect.left, 0, i, rect) for i, rect in rects_a]
+    items += [(rect.left, 1, j, rect) for j, rect in rects_b]
+    items.sort(key=lambda item: item[0])
+    active = ([], [])  # rects of group a / b which may overlap the next
+    pairs = []
+    for left, side, index, rect in items:
+        other = active[1 - side]
+        other[:] = [each for each in other if each[1].right > left]
+        for other_index, other_rect in other:
+            if rect.top < other_rect.bottom and other_rect.top < rect.bottom:
+                pairs.append((index, other_index) if side == 0 else
+                             (other_index, index))
+        active[side].append((index, rect))
+    return sorted(pairs)
+
+
+def nearest(pos, group, k=1):
+    """return k sprites of a group nearest to a position, sprites are
+    looked up ring by ring in grid cells around position
+
+    Args:
+        pos (tuple): Description
+        group (str/list): group name or SpriteObj list
+        k (int, optional): count of sprites
+
+    Returns:
+        list: SpriteObj ordered by distance, less than k if group is small
+    """
+    if k <= 0:
+        return []
+    x, y = pos
+    if not isinstance(group, str):
+        found = [((obj._vpos[0] - x) ** 2 + (obj._vpos[1] - y) ** 2,
+                  obj._oid, obj) for obj in group]
+        return [obj for _, _, obj in sorted(found)[:k]]
+    cells = SpriteObj._group_cells(group)
+    size = SpriteObj._grid_cell
+    cx, cy = int(x // size), int(y // size)
+    found = []
+    left = len(cells)  # cells not looked up
+    ring = 0
+    while left:
+        if len(found) >= k:
+            found.sort()
+            # sprites in outer rings are (ring - 1) cells away at least
+            if found[k - 1][0] < ((ring - 1) * size) ** 2:
+                break
+        if 8 * ring >= left:
+            # ring is larger than rest cells, check all of them
+            for (x0, y0), entries in cells.items():
+                if max(abs(x0 - cx), abs(y0 - cy)) >= ring:
+                    __add_nearby(found, entries, x, y)
+            break
+        for cell in __ring_cells(cx, cy, ring):
+            entries = cells.get(cell)
+            if entries:
+                left -= 1
+                __add_nearby(found, entries, x, y)
+        ring += 1
+    found.sort()
+    return [obj for _, _, obj in found[:k]]
+
+
+def within_radius(pos, r, group):
+    """return sprites of a group whose center is in a circle
+
+    Args:
+        pos (tuple): center of circle
+        r (int): radius of circle
+        group (str/list): group name or SpriteObj list
+
+    Returns:
+        list: SpriteObj ordered by distance
+    """
+    x, y = pos
+    found = []
+    if not isinstance(group, str):
+        __add_nearby(found, [(obj._vpos[0], obj._vpos[1], obj)
+                             for obj in group], x, y)
+    else:
+        cells = SpriteObj._group_cells(group)
+        size = SpriteObj._grid_cell
+        x0, y0 = int((x - r) // size), int((y - r) // size)
+        x1, y1 = int((x + r) // size), int((y + r) // size)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # circle covers more cells than saved
+            for (cx, cy), entries in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    __add_nearby(found, entries, x, y)
+        else:
+            for cy in range(y0, y1 + 1):
+                for cx in range(x0, x1 + 1):
+                    entries = cells.get((cx, cy))
+                    if entries:
+                        __add_nearby(found, entries, x, y)
+    found = [each for each in found if each[0] <= r * r]
+    found.sort()
+    return [obj for _, _, obj in found]
+
+
+def __add_nearby(found, entries, x, y):
+    """append (squared distance, oid, SpriteObj) of entries to found
+
+    Args:
+        found (list): Description
+        entries (list): (x, y, SpriteObj) of sprite centers
+        x (float): Description
+        y (float): Description
+    """
+    found.extend(((ex - x) ** 2 + (ey - y) ** 2, obj._oid, obj)
+                 for ex, ey, obj in entries)
+
+
+def __ring_cells(cx, cy, ring):
+    """return cells in a square ring around (cx, cy)
+
+    Args:
+        cx (int): Description
+        cy (int): Description
+        ring (int): cells from (cx, cy) to ring
+
+    Returns:
+        list: (cx, cy) of cells
+    """
+    if not ring:
+        return [(cx, cy)]
+    cells = []
+    for dx in range(-ring, ring + 1):
+        cells.append((cx + dx, cy - ring))
+        cells.append((cx + dx, cy + ring))
+    for dy in range(1 - ring, ring):
+        cells.append((cx - ring, cy + dy))
+        cells.append((cx + ring, cy + dy))
+    return cells
+
+
 def get_sprite_by_name(prefix):
     """Summary
 
@@ -1145,7 +3323,8 @@ def get_sprite_in_pos(xy_or_x, y=None):
     """
     objs = []
     pos = (xy_or_x, y) if y is not None else xy_or_x
-    for obj in SpriteObj._obj_dict.values():
+    near = SpriteObj._grid_query(pygame.Rect(pos[0], pos[1], 1, 1))
+    for obj in sorted(near, key=lambda obj: obj._oid):
         if obj.in_pos(pos):
             objs.append(obj)
     return objs
@@ -1197,21 +3376,27 @@ def mouse_down(button='any'):
         return this.mouse_btn != ''
 
 
-# init window when module imported
-pygame.init()
+# window is opened by init(), at first set_size(), run() or create_sprite()
 # this is a pointer to the module object instance itself.
 this = sys.modules[__name__]
 # we can explicitly make assignments on it
 this.status_bar = True
+this.dirty_rect = False  # True to re-draw the changed area only
 this.__font_family = 'Console'
 this.__font_size = 16
-this.__font_obj = pygame.font.SysFont(this.__font_family, this.__font_size)
-this.__font_height = this.__font_obj.get_linesize()
+this.__font_obj = None  # loaded at first status bar drawing
 this.size = (800, 600)
 this.__screen_resizable = True
 this.closed = False
-this.__screen = pygame.display.set_mode(this.size, 0, 32)
-this.__clock = pygame.time.Clock()
+this.__screen = None  # opened by init()
+this.__clock = None
+this.__caption = __name__
+this.headless = os.environ.get('SCREEN_HEADLESS', '0') not in ('', '0')
+this.__frame_rate = 0 if this.headless else 100  # 0 means not limited
+this.__frame_msec = 0  # milliseconds of last frame
+this.__sim_time = 0  # milliseconds not simulated yet
+this.max_sim_steps = 10  # max simulation steps in one run()
+this.sim_steps = 0  # simulation steps run by last run()
 this.__event_dict = {}  # event id (int) : event name (string)
 this.__event_cb = {}  # event name (string) : event cb (function)
 this.keys = []  # for performance
@@ -1221,6 +3406,13 @@ this.mouse_x = 0
 this.mouse_y = 0
 this.mouse_rel = (0, 0)
 this.fps = 0
-__init_event()
-pygame.display.set_caption(__name__)
-create_sprite('__backdrop__').hide()
+this.__backdrop_drawn = None  # (backdrop surface, screen size) last drawn
+this.__backdrop_key = None  # (backdrop costume, screen size) composed
+this.__backdrop_surf = None  # composed screen size backdrop
+this.__status_fields = None  # (label, value) text of status bar
+this.__status_surf = None  # rendered status bar
+this.__status_labels = {}  # label text : rendered label
+this.__status_values = {}  # label text : (value text, rendered value)
+this.__preloaders = []  # Preloader not done yet
+this.__costume_sets = {}  # image list : shared CostumeSet
+SpriteObj('__backdrop__').hide()
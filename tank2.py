@@ -42,13 +42,16 @@ class TankObj():
             if not self._fire_colddown or screen.now_time() - self._fire_colddown > 200:
                 mdir = self.head.dir
                 obj = screen.create_sprite(
-                    'bullet_XXXXXX', self, './pics/bullet1.png', self.foot.pos)
+                    'bullet_XXXXXX', self, './pics/bullet1.png', self.foot.pos,
+                    group='bullet')
                 obj.set_auto_move(5, mdir)
                 obj = screen.create_sprite(
-                    'bullet_XXXXXX', self, './pics/bullet1.png', self.foot.pos)
+                    'bullet_XXXXXX', self, './pics/bullet1.png', self.foot.pos,
+                    group='bullet')
                 obj.set_auto_move(5, mdir - 5)
                 obj = screen.create_sprite(
-                    'bullet_XXXXXX', self, './pics/bullet1.png', self.foot.pos)
+                    'bullet_XXXXXX', self, './pics/bullet1.png', self.foot.pos,
+                    group='bullet')
                 obj.set_auto_move(5, mdir + 5)
                 self._fire_colddown = screen.now_time()
         else:
@@ -82,7 +85,7 @@ class TargetObj():
 
     def update(self):
         if self.hp > 0:
-            bullets = screen.get_sprite_by_name('bullet_')
+            bullets = screen.group('bullet')
             collide_bullets = self.body.collide_objs(bullets)
             if collide_bullets:
                 print(collide_bullets, end=',')
@@ -104,10 +107,13 @@ if __name__ == '__main__':
     tank = TankObj()
     target = TargetObj()
 
-    while not screen.closed:
-        tick = screen.run()
+    def update():
         tank.update()
         target.update()
 
+    # game logic runs at 100 Hz even if frame rate drops
+    while not screen.closed:
+        screen.run(timestep=10, step=update)
+
     # exit
     print("end")